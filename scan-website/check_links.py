@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+Vérificateur de liens morts pour les images des comics scrapés
+Teste chaque imageUrl de ./data/*.json et signale les chapitres à re-scraper
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_DATA_DIR = "./data"
+DEFAULT_REPORT_PATH = "./reports/link-health.json"
+
+# Codes pour lesquels le serveur refuse HEAD: on retente avec un GET d'un seul octet
+HEAD_FALLBACK_STATUSES = {403, 405, 501}
+
+# Codes transitoires (limitation de débit, serveur surchargé): retentés avec backoff,
+# puis comptés comme "inconnus" plutôt que morts s'ils persistent
+TRANSIENT_STATUSES = [429, 500, 502, 503, 504]
+
+CHECK_METHODS = ('head', 'range')
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Referer": "https://readcomiconline.li/",
+}
+
+def load_comic_files(data_dir: str) -> List[Dict]:
+    """Charge tous les fichiers comics (format ScrapedData) du dossier data"""
+    comics = []
+    for path in sorted(glob.glob(os.path.join(data_dir, '*.json'))):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Erreur lors du chargement de {path}: {e}")
+            continue
+        if isinstance(data, dict) and isinstance(data.get('series'), dict):
+            comics.append({'file': os.path.basename(path), 'series': data['series']})
+    return comics
+
+def url_host(url: str) -> Optional[str]:
+    """Retourne l'hôte d'une URL, ou None si elle est mal formée"""
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        return None
+    return parsed.netloc
+
+def group_by_host(urls: List[str]) -> Dict[str, deque]:
+    """Regroupe les URLs valides par hôte (les URLs mal formées sont ignorées)"""
+    by_host = defaultdict(deque)
+    for url in urls:
+        host = url_host(url)
+        if host is not None:
+            by_host[host].append(url)
+    return by_host
+
+class LinkChecker:
+    """
+    Teste des URLs d'images en parallèle (HEAD, ou GET limité à un octet),
+    avec une limite de requêtes simultanées par hôte appliquée à la soumission
+    """
+
+    def __init__(self, concurrency: int = 64, per_host: Optional[int] = None,
+                 timeout: float = 10.0, method: str = 'head',
+                 retries: int = 3, backoff_factor: float = 0.5):
+        if method not in CHECK_METHODS:
+            raise ValueError(f"Méthode inconnue: {method} (attendu: {', '.join(CHECK_METHODS)})")
+        self.concurrency = concurrency
+        self.per_host = per_host or concurrency
+        self.timeout = timeout
+        self.method = method
+        self.retry = Retry(
+            total=retries, connect=retries, read=retries, status=retries,
+            status_forcelist=TRANSIENT_STATUSES, allowed_methods=['HEAD', 'GET'],
+            backoff_factor=backoff_factor, raise_on_status=False
+        )
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """Session HTTP du thread courant, avec pool de connexions keep-alive et retries"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=self.per_host, pool_maxsize=self.per_host,
+                                  max_retries=self.retry)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._local.session = session
+        return session
+
+    def _ranged_get(self, session: requests.Session, url: str) -> requests.Response:
+        response = session.get(url, headers={'Range': 'bytes=0-0'}, timeout=self.timeout,
+                               stream=True, allow_redirects=True)
+        response.close()
+        return response
+
+    def check(self, url: str) -> Dict:
+        """
+        Teste une URL et retourne {'url', 'ok', 'unknown', 'status', 'error'}.
+        'unknown' signale un échec transitoire persistant (timeout, connexion, 429/5xx)
+        """
+        session = self._session()
+        ranged = self.method == 'range'
+        try:
+            if ranged:
+                response = self._ranged_get(session, url)
+            else:
+                response = session.head(url, timeout=self.timeout, allow_redirects=True)
+                if response.status_code in HEAD_FALLBACK_STATUSES:
+                    ranged = True
+                    response = self._ranged_get(session, url)
+        except ValueError:
+            return {'url': url, 'ok': False, 'unknown': False, 'status': None, 'error': 'InvalidURL'}
+        except (requests.Timeout, requests.ConnectionError) as e:
+            return {'url': url, 'ok': False, 'unknown': True, 'status': None, 'error': type(e).__name__}
+        except requests.RequestException as e:
+            return {'url': url, 'ok': False, 'unknown': False, 'status': None, 'error': type(e).__name__}
+
+        # 416 sur un GET partiel: l'objet existe mais est vide
+        if ranged and response.status_code == 416:
+            return {'url': url, 'ok': True, 'unknown': False, 'status': 416, 'error': None}
+
+        if response.status_code in TRANSIENT_STATUSES:
+            return {'url': url, 'ok': False, 'unknown': True, 'status': response.status_code,
+                    'error': f"HTTP {response.status_code}"}
+
+        content_type = response.headers.get('Content-Type', '')
+        ok = response.status_code < 400 and not content_type.startswith('text/html')
+        error = None
+        if not ok:
+            error = f"HTTP {response.status_code}" if response.status_code >= 400 else f"Content-Type {content_type}"
+        return {'url': url, 'ok': ok, 'unknown': False, 'status': response.status_code, 'error': error}
+
+    def max_in_flight(self, by_host: Dict[str, deque]) -> int:
+        """Nombre maximum de requêtes simultanées atteignable compte tenu de la limite par hôte"""
+        return min(self.concurrency, sum(min(self.per_host, len(queue)) for queue in by_host.values()))
+
+    def check_all(self, urls: List[str]) -> Dict[str, Dict]:
+        """Teste toutes les URLs (dédupliquées) et retourne les résultats indexés par URL"""
+        unique_urls = list(dict.fromkeys(urls))
+        results = {}
+        for url in unique_urls:
+            if url_host(url) is None:
+                results[url] = {'url': url, 'ok': False, 'unknown': False, 'status': None, 'error': 'InvalidURL'}
+
+        by_host = group_by_host(unique_urls)
+        active = defaultdict(int)
+        in_flight = {}
+        started_at = time.time()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while True:
+                # Soumettre en tourniquet sur les hôtes tant qu'il reste des places,
+                # sans jamais dépasser la limite par hôte (aucun thread ne reste bloqué)
+                submitted = True
+                while submitted and len(in_flight) < self.concurrency:
+                    submitted = False
+                    for host, queue in by_host.items():
+                        if len(in_flight) >= self.concurrency:
+                            break
+                        if queue and active[host] < self.per_host:
+                            url = queue.popleft()
+                            active[host] += 1
+                            in_flight[executor.submit(self.check, url)] = host
+                            submitted = True
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    active[in_flight.pop(future)] -= 1
+                    result = future.result()
+                    results[result['url']] = result
+                    if len(results) % 1000 == 0 or len(results) == len(unique_urls):
+                        elapsed = time.time() - started_at
+                        rate = len(results) / elapsed if elapsed > 0 else 0.0
+                        print(f"  {len(results)}/{len(unique_urls)} URLs vérifiées ({rate:.0f}/s)")
+        return results
+
+def build_report(comics: List[Dict], results: Dict[str, Dict], threshold: float) -> Dict:
+    """Construit le rapport de santé par chapitre à partir des résultats"""
+    report_comics = []
+    rescrape = []
+    for comic in comics:
+        series = comic['series']
+        chapters = []
+        for chapter in series.get('chapters', []):
+            pages = [page for page in chapter.get('pages', []) if page.get('imageUrl')]
+            failures = []
+            unknown = []
+            for page in pages:
+                result = results[page['imageUrl']]
+                if not result['ok']:
+                    entry = {
+                        'pageNumber': page.get('pageNumber'),
+                        'imageUrl': page['imageUrl'],
+                        'status': result['status'],
+                        'error': result['error']
+                    }
+                    (unknown if result['unknown'] else failures).append(entry)
+            # Les résultats inconnus ne comptent ni comme morts ni comme valides
+            determined = len(pages) - len(unknown)
+            failure_rate = len(failures) / determined if determined else 0.0
+            needs_rescrape = bool(failures) and failure_rate >= threshold
+            chapters.append({
+                'id': chapter.get('id'),
+                'title': chapter.get('title'),
+                'url': chapter.get('url'),
+                'checked': len(pages),
+                'failed': len(failures),
+                'unknown': len(unknown),
+                'failureRate': round(failure_rate, 4),
+                'needsRescrape': needs_rescrape,
+                'failures': failures,
+                'unknownFailures': unknown
+            })
+            if needs_rescrape:
+                rescrape.append({
+                    'file': comic['file'],
+                    'seriesId': series.get('id'),
+                    'chapterId': chapter.get('id'),
+                    'url': chapter.get('url')
+                })
+        report_comics.append({
+            'file': comic['file'],
+            'id': series.get('id'),
+            'title': series.get('title'),
+            'chapters': chapters
+        })
+
+    return {
+        'checkedAt': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+        'threshold': threshold,
+        'totalUrls': len(results),
+        'failedUrls': sum(1 for result in results.values() if not result['ok'] and not result['unknown']),
+        'unknownUrls': sum(1 for result in results.values() if result['unknown']),
+        'rescrape': rescrape,
+        'comics': report_comics
+    }
+
+def main():
+    """Point d'entrée principal"""
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print("""
+Usage:
+  python check_links.py [options]
+
+Options:
+  --data-dir <path>          Dossier des comics scrapés (défaut: ./data)
+  --output <path>            Rapport de sortie (défaut: ./reports/link-health.json)
+  --threshold <ratio>        Taux d'échec à partir duquel un chapitre avec au moins
+                             un lien mort est à re-scraper (défaut: 0.1)
+  --concurrency <number>     Nombre de requêtes simultanées (défaut: 64)
+  --per-host <number>        Requêtes simultanées maximum par hôte (défaut: --concurrency)
+  --timeout <seconds>        Délai d'attente par requête (défaut: 10)
+  --method <head|range>      HEAD (repli en GET d'un octet) ou GET d'un octet uniquement (défaut: head)
+  --retries <number>         Tentatives sur timeout, erreur de connexion et 429/5xx (défaut: 3)
+
+Exemples:
+  python check_links.py
+  python check_links.py --threshold 0.05 --concurrency 128
+  python check_links.py --concurrency 128 --per-host 32
+        """)
+        sys.exit(0)
+
+    data_dir = DEFAULT_DATA_DIR
+    output_path = DEFAULT_REPORT_PATH
+    threshold = 0.1
+    concurrency = 64
+    per_host = None
+    timeout = 10.0
+    method = 'head'
+    retries = 3
+
+    # Parser les arguments
+    i = 1
+    while i < len(sys.argv):
+        if sys.argv[i] == "--data-dir" and i + 1 < len(sys.argv):
+            data_dir = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == "--output" and i + 1 < len(sys.argv):
+            output_path = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == "--threshold" and i + 1 < len(sys.argv):
+            threshold = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--concurrency" and i + 1 < len(sys.argv):
+            concurrency = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--per-host" and i + 1 < len(sys.argv):
+            per_host = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--timeout" and i + 1 < len(sys.argv):
+            timeout = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--method" and i + 1 < len(sys.argv):
+            method = sys.argv[i + 1]
+            if method not in CHECK_METHODS:
+                print(f"Erreur: --method doit valoir {' ou '.join(CHECK_METHODS)} (reçu: {method})")
+                print("Utilisez --help pour l'aide")
+                sys.exit(1)
+            i += 2
+        elif sys.argv[i] == "--retries" and i + 1 < len(sys.argv):
+            retries = int(sys.argv[i + 1])
+            i += 2
+        else:
+            i += 1
+
+    comics = load_comic_files(data_dir)
+    urls = [
+        page['imageUrl']
+        for comic in comics
+        for chapter in comic['series'].get('chapters', [])
+        for page in chapter.get('pages', [])
+        if page.get('imageUrl')
+    ]
+
+    print(f"\n🔗 Vérification de {len(urls)} URLs d'images ({len(comics)} comics)")
+    started_at = time.time()
+    checker = LinkChecker(concurrency=concurrency, per_host=per_host, timeout=timeout,
+                          method=method, retries=retries)
+    print(f"⚙️  Concurrence: {concurrency}, par hôte: {checker.per_host}, méthode: {method}")
+    by_host = group_by_host(list(dict.fromkeys(urls)))
+    reachable = checker.max_in_flight(by_host)
+    if by_host and reachable < concurrency:
+        busiest = max(by_host, key=lambda host: len(by_host[host]))
+        print(f"⚠️  {len(by_host)} hôte(s), dont {busiest} ({len(by_host[busiest])} URLs): "
+              f"au plus {reachable} requêtes simultanées avec --per-host {checker.per_host}")
+    results = checker.check_all(urls)
+    report = build_report(comics, results, threshold)
+
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print(f"\n✅ Vérification terminée en {time.time() - started_at:.1f}s")
+    print(f"📊 Statistiques:")
+    print(f"   - URLs vérifiées: {report['totalUrls']}")
+    print(f"   - URLs en échec: {report['failedUrls']}")
+    print(f"   - URLs inconnues (erreurs transitoires persistantes): {report['unknownUrls']}")
+    print(f"   - Chapitres à re-scraper: {len(report['rescrape'])}")
+    for entry in report['rescrape']:
+        print(f"     • {entry['seriesId']} / {entry['chapterId']}: {entry['url']}")
+    print(f"   - Rapport sauvegardé: {output_path}\n")
+
+if __name__ == "__main__":
+    main()
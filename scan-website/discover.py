@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Crawler de découverte pour readcomiconline.li
+Parcourt les pages de listing (genres, éditeurs, dernières mises à jour)
+et produit un manifeste des séries trouvées
+"""
+
+import json
+import os
+import re
+import sys
+import time
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlparse, parse_qs, quote, unquote
+from bs4 import BeautifulSoup
+import requests
+
+from scraper import BASE_URL
+
+DEFAULT_FRONTIER_PATH = "./discovery/frontier.db"
+DEFAULT_MANIFEST_PATH = "./discovery/manifest.json"
+
+# Pages de départ du crawl
+SEED_PATHS = [
+    "/ComicList/LatestUpdate",
+    "/ComicList/Newest",
+    "/ComicList",
+]
+
+# Headers pour simuler un navigateur
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+SERIES_PATH_RE = re.compile(r'^/Comic/([^/?#]+)/?$')
+LISTING_PATH_RE = re.compile(r'^/(Genre|Publisher|ComicList|Search)(/[^?#]*)?$', re.I)
+
+_thread_local = threading.local()
+
+def get_session() -> requests.Session:
+    """Retourne une session HTTP par thread (pool de connexions réutilisé)"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        _thread_local.session = session
+    return session
+
+def normalize_listing_url(url: str) -> Optional[str]:
+    """
+    Normalise une URL de listing pour la déduplication: même hôte que BASE_URL,
+    sans fragment, seul le paramètre 'page' est conservé
+    """
+    parsed = urlparse(urljoin(BASE_URL, url))
+    if parsed.netloc != urlparse(BASE_URL).netloc:
+        return None
+    if not LISTING_PATH_RE.match(parsed.path):
+        return None
+    path = parsed.path.rstrip('/') or '/'
+    page = parse_qs(parsed.query).get('page', [''])[0]
+    if page.isdigit() and int(page) > 1:
+        return f"{BASE_URL}{path}?page={int(page)}"
+    return f"{BASE_URL}{path}"
+
+def listing_base_url(url: str) -> str:
+    """URL de la première page d'un listing (sans le paramètre 'page')"""
+    return url.split('?')[0]
+
+def listing_facet(url: str, label: Optional[str] = None) -> Tuple[str, str]:
+    """
+    Retourne le type de listing ('genre', 'publisher', ...) et sa valeur. La valeur
+    est le texte du lien qui a mené au listing, comme dans scrape_comic_series,
+    ou à défaut le segment d'URL décodé
+    """
+    parts = urlparse(url).path.strip('/').split('/')
+    kind = parts[0].lower()
+    value = label or (unquote(parts[1]) if len(parts) > 1 else '')
+    return kind, value
+
+def parse_listing_page(url: str, html: str) -> Dict:
+    """Extrait les séries et les liens vers d'autres pages de listing"""
+    soup = BeautifulSoup(html, 'html.parser')
+    series = {}
+    alt_titles = {}
+    listings = set()
+    labels = {}
+
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '')
+        absolute = urljoin(url, href)
+        parsed = urlparse(absolute)
+        if parsed.netloc != urlparse(BASE_URL).netloc:
+            continue
+
+        match = SERIES_PATH_RE.match(parsed.path)
+        if match:
+            series_url = f"{BASE_URL}/Comic/{match.group(1)}"
+            entry = series.setdefault(series_url, {
+                'id': match.group(1),
+                'title': '',
+                'url': series_url,
+                'coverImage': ''
+            })
+            title = link.get_text(strip=True)
+            if title and not entry['title']:
+                entry['title'] = title
+            img = link.find('img')
+            if img and img.get('src') and not entry['coverImage']:
+                entry['coverImage'] = urljoin(BASE_URL, img.get('src'))
+                alt_titles.setdefault(series_url, img.get('alt', '').strip())
+            continue
+
+        listing_url = normalize_listing_url(absolute)
+        if listing_url and listing_url != url:
+            listings.add(listing_url)
+            # Le texte des liens de pagination ("2", "Next") n'est pas un nom de listing
+            text = link.get_text(strip=True)
+            if text and listing_url == listing_base_url(listing_url):
+                labels.setdefault(listing_url, text)
+
+    # Le texte alt de la couverture ne sert que si aucun lien texte n'a été trouvé
+    for series_url, entry in series.items():
+        if not entry['title']:
+            entry['title'] = alt_titles.get(series_url, '')
+
+    return {'series': list(series.values()), 'listings': sorted(listings), 'labels': labels}
+
+def fetch_listing(url: str, delay: float, timeout: float) -> Dict:
+    """Télécharge et analyse une page de listing (exécuté dans un thread du pool)"""
+    time.sleep(delay)
+    response = get_session().get(url, timeout=timeout)
+    response.raise_for_status()
+    return parse_listing_page(url, response.text)
+
+class Frontier:
+    """
+    Frontière d'URLs persistante et dédupliquée (SQLite).
+    Une page de listing n'est revisitée qu'une fois son TTL expiré
+    """
+
+    def __init__(self, path: str, ttl: float):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS listings (
+                url TEXT PRIMARY KEY,
+                fetched_at REAL,
+                error TEXT,
+                label TEXT
+            );
+            CREATE TABLE IF NOT EXISTS series (
+                url TEXT PRIMARY KEY,
+                id TEXT NOT NULL,
+                title TEXT NOT NULL DEFAULT '',
+                cover_image TEXT NOT NULL DEFAULT '',
+                genres TEXT NOT NULL DEFAULT '[]',
+                publishers TEXT NOT NULL DEFAULT '[]',
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL
+            );
+        """)
+        # Frontières créées avant l'ajout de la colonne label
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(listings)")]
+        if 'label' not in columns:
+            self.conn.execute("ALTER TABLE listings ADD COLUMN label TEXT")
+        self.conn.commit()
+
+    def add_listings(self, urls: List[str], labels: Optional[Dict[str, str]] = None):
+        """Ajoute des pages de listing (les doublons sont ignorés) et leur libellé"""
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO listings (url) VALUES (?)",
+            [(url,) for url in urls]
+        )
+        if labels:
+            self.conn.executemany(
+                "UPDATE listings SET label = ? WHERE url = ? AND label IS NULL",
+                [(label, url) for url, label in labels.items()]
+            )
+
+    def listing_label(self, url: str) -> Optional[str]:
+        """Libellé du listing (texte du lien vers sa première page), s'il est connu"""
+        row = self.conn.execute(
+            "SELECT label FROM listings WHERE url = ?", (listing_base_url(url),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def next_due(self, limit: int, exclude: set, run_started_at: Optional[float] = None) -> List[str]:
+        """
+        Pages jamais visitées (ou en échec) ou dont le TTL a expiré. Une page
+        visitée depuis `run_started_at` n'est jamais rendue, même si le TTL est court
+        """
+        cutoff = time.time() - self.ttl
+        if run_started_at is not None:
+            cutoff = min(cutoff, run_started_at)
+        rows = self.conn.execute(
+            "SELECT url FROM listings WHERE fetched_at IS NULL OR fetched_at < ? "
+            "ORDER BY fetched_at IS NOT NULL, fetched_at LIMIT ?",
+            (cutoff, limit + len(exclude))
+        ).fetchall()
+        return [url for (url,) in rows if url not in exclude][:limit]
+
+    def mark_fetched(self, url: str):
+        self.conn.execute(
+            "UPDATE listings SET fetched_at = ?, error = NULL WHERE url = ?",
+            (time.time(), url)
+        )
+
+    def mark_failed(self, url: str, error: str):
+        """Enregistre l'erreur sans dater la page, qui reste à visiter au prochain crawl"""
+        self.conn.execute(
+            "UPDATE listings SET fetched_at = NULL, error = ? WHERE url = ?",
+            (error, url)
+        )
+
+    def add_series(self, entries: List[Dict], source_url: str):
+        """Ajoute ou met à jour des séries, en y rattachant le genre/éditeur du listing"""
+        kind, value = listing_facet(source_url, self.listing_label(source_url))
+        now = time.time()
+        for entry in entries:
+            row = self.conn.execute(
+                "SELECT title, cover_image, genres, publishers FROM series WHERE url = ?",
+                (entry['url'],)
+            ).fetchone()
+            if row:
+                title, cover_image, genres, publishers = row
+                genres, publishers = json.loads(genres), json.loads(publishers)
+            else:
+                title, cover_image, genres, publishers = '', '', [], []
+
+            if kind == 'genre' and value and value not in genres:
+                genres.append(value)
+            if kind == 'publisher' and value and value not in publishers:
+                publishers.append(value)
+
+            self.conn.execute(
+                "INSERT INTO series (url, id, title, cover_image, genres, publishers, first_seen, last_seen) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET title = excluded.title, cover_image = excluded.cover_image, "
+                "genres = excluded.genres, publishers = excluded.publishers, last_seen = excluded.last_seen",
+                (entry['url'], entry['id'], title or entry['title'], cover_image or entry['coverImage'],
+                 json.dumps(genres), json.dumps(publishers), now, now)
+            )
+
+    def commit(self):
+        self.conn.commit()
+
+    def all_series(self) -> List[Dict]:
+        rows = self.conn.execute(
+            "SELECT id, title, url, cover_image, genres, publishers FROM series ORDER BY id"
+        ).fetchall()
+        return [
+            {
+                'id': series_id,
+                'title': title,
+                'url': url,
+                'coverImage': cover_image,
+                'genres': json.loads(genres),
+                'publishers': json.loads(publishers)
+            }
+            for series_id, title, url, cover_image, genres, publishers in rows
+        ]
+
+    def close(self):
+        self.conn.close()
+
+def discover_series(frontier: Frontier, seeds: List[str], concurrency: int = 4,
+                    delay: float = 0.5, timeout: float = 30.0,
+                    max_pages: Optional[int] = None) -> Dict:
+    """
+    Crawl les pages de listing de la frontière avec au plus `concurrency`
+    requêtes en parallèle. Retourne des statistiques du crawl
+    """
+    seed_urls = []
+    for seed in seeds:
+        url = normalize_listing_url(seed)
+        if url is None:
+            print(f"⚠️  Page de départ ignorée (hôte différent ou pas une page de listing): {seed}")
+        else:
+            seed_urls.append(url)
+    frontier.add_listings(seed_urls)
+    frontier.commit()
+
+    run_started_at = time.time()
+    attempted = 0
+    fetched = 0
+    errors = 0
+    in_flight = {}
+    # Pages en échec pendant ce crawl: toujours dues en base, mais pas retentées tout de suite
+    failed = set()
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            # Remplir le pool jusqu'à la limite de concurrence
+            budget = concurrency - len(in_flight)
+            if max_pages is not None:
+                budget = min(budget, max_pages - attempted - len(in_flight))
+            if budget > 0:
+                exclude = set(in_flight.values()) | failed
+                for url in frontier.next_due(budget, exclude, run_started_at):
+                    in_flight[executor.submit(fetch_listing, url, delay, timeout)] = url
+
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                url = in_flight.pop(future)
+                attempted += 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    errors += 1
+                    print(f"Erreur lors de la récupération de {url}: {e}")
+                    failed.add(url)
+                    frontier.mark_failed(url, str(e))
+                    continue
+                frontier.add_series(result['series'], url)
+                frontier.add_listings(result['listings'], result['labels'])
+                frontier.mark_fetched(url)
+                fetched += 1
+                print(f"[{fetched}] {url}: {len(result['series'])} séries, "
+                      f"{len(result['listings'])} listings")
+            frontier.commit()
+
+    return {'fetched': fetched, 'errors': errors}
+
+def write_manifest(frontier: Frontier, output_path: str) -> Dict:
+    """Écrit le manifeste JSON des séries découvertes"""
+    series = frontier.all_series()
+    manifest = {
+        'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime()),
+        'source': BASE_URL,
+        'totalSeries': len(series),
+        'series': series
+    }
+    directory = os.path.dirname(output_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+def main():
+    """Point d'entrée principal"""
+    if "--help" in sys.argv or "-h" in sys.argv:
+        print("""
+Usage:
+  python discover.py [options]
+
+Options:
+  --seed <url>               Page de listing de départ (répétable, défaut: dernières mises à jour)
+  --search <query>           Ajoute la page de recherche correspondante aux pages de départ
+  --concurrency <number>     Nombre de requêtes simultanées (défaut: 4)
+  --delay <seconds>          Délai avant chaque requête, par worker (défaut: 0.5)
+  --ttl <hours>              Durée avant de revisiter une page de listing (défaut: 24)
+  --max-pages <number>       Limite le nombre de pages de listing visitées
+  --frontier <path>          Base SQLite de la frontière (défaut: ./discovery/frontier.db)
+  --output <path>            Manifeste de sortie (défaut: ./discovery/manifest.json)
+
+Exemples:
+  python discover.py
+  python discover.py --seed "https://readcomiconline.li/Genre/Action" --max-pages 50
+  python discover.py --search "batman" --concurrency 8
+        """)
+        sys.exit(0)
+
+    seeds = []
+    concurrency = 4
+    delay = 0.5
+    ttl_hours = 24.0
+    max_pages = None
+    frontier_path = DEFAULT_FRONTIER_PATH
+    output_path = DEFAULT_MANIFEST_PATH
+
+    # Parser les arguments
+    i = 1
+    while i < len(sys.argv):
+        if sys.argv[i] == "--seed" and i + 1 < len(sys.argv):
+            seeds.append(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--search" and i + 1 < len(sys.argv):
+            seeds.append(f"{BASE_URL}/Search/{quote(sys.argv[i + 1])}")
+            i += 2
+        elif sys.argv[i] == "--concurrency" and i + 1 < len(sys.argv):
+            concurrency = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--delay" and i + 1 < len(sys.argv):
+            delay = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--ttl" and i + 1 < len(sys.argv):
+            ttl_hours = float(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--max-pages" and i + 1 < len(sys.argv):
+            max_pages = int(sys.argv[i + 1])
+            i += 2
+        elif sys.argv[i] == "--frontier" and i + 1 < len(sys.argv):
+            frontier_path = sys.argv[i + 1]
+            i += 2
+        elif sys.argv[i] == "--output" and i + 1 < len(sys.argv):
+            output_path = sys.argv[i + 1]
+            i += 2
+        else:
+            i += 1
+
+    if not seeds:
+        seeds = [f"{BASE_URL}{path}" for path in SEED_PATHS]
+
+    print(f"\n🔎 Découverte depuis {len(seeds)} page(s) de départ")
+    print(f"⚙️  Concurrence: {concurrency}, TTL: {ttl_hours}h")
+
+    frontier = Frontier(frontier_path, ttl=ttl_hours * 3600)
+    try:
+        stats = discover_series(frontier, seeds, concurrency=concurrency, delay=delay,
+                                max_pages=max_pages)
+        manifest = write_manifest(frontier, output_path)
+    except Exception as e:
+        print(f"\n❌ Erreur lors de la découverte: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        frontier.close()
+
+    print(f"\n✅ Découverte terminée!")
+    print(f"📊 Statistiques:")
+    print(f"   - Pages de listing visitées: {stats['fetched']}")
+    print(f"   - Erreurs: {stats['errors']}")
+    print(f"   - Séries connues: {manifest['totalSeries']}")
+    print(f"   - Manifeste sauvegardé: {output_path}\n")
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ import time
 import re
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Optional
 from urllib.parse import urljoin, urlparse
 from selenium import webdriver
@@ -17,6 +18,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import WebDriverException, InvalidSessionIdException
 from bs4 import BeautifulSoup
 import requests
 
@@ -253,366 +255,514 @@ def scrape_comic_series(comic_url: str) -> Dict:
     finally:
         driver.quit()
 
-def scrape_chapter_pages(chapter_url: str, delay: float = 1.0) -> List[Dict]:
-    """Scrape toutes les pages d'un chapitre"""
-    print(f"Scraping des pages du chapitre: {chapter_url}")
-    time.sleep(delay)
+# Script exécuté dans le navigateur pour extraire les URLs d'images depuis le DOM et les scripts
+EXTRACT_IMAGE_URLS_JS = """
+    var urls = [];
+    var seen = {};
     
-    driver = setup_driver()
-    pages = []
-    seen_urls = set()
+    // Fonction pour vérifier si c'est une page valide
+    function isValid(url) {
+        var lower = url.toLowerCase();
+        var exclude = ['logo', 'user-small', 'read.png', 'previous.png', 'next.png', 
+                       'error.png', 'search.png', 'button', 'icon', 'avatar',
+                       'advertisement', 'ad', 'banner', 'widget', 'sharethis',
+                       'facebook', 'twitter', 'google', 'discord', 'mgid.com',
+                       'a-ads.com', 'lowseelor.com'];
+        for (var i = 0; i < exclude.length; i++) {
+            if (lower.indexOf(exclude[i]) !== -1) return false;
+        }
+        var isBlogspot = lower.indexOf('blogspot') !== -1 || 
+                       lower.indexOf('bp.blogspot') !== -1 ||
+                       lower.indexOf('blogger.com') !== -1;
+        var hasImage = /rco\\d+\\.(jpg|jpeg|png|webp)/i.test(url) ||
+                      /\\/s\\d+\\//.test(url) ||
+                      /\\/pw\\//.test(url) ||
+                      /\\.(jpg|jpeg|png|webp)(\\?|$)/i.test(url);
+        return isBlogspot && hasImage;
+    }
+    
+    // Normaliser l'URL
+    function normalize(url) {
+        try {
+            var match = url.match(/\\/([^/\\?#]+\\.(jpg|jpeg|png|webp))$/i);
+            if (match) return match[1].toLowerCase();
+            return url.split('?')[0].split('#')[0];
+        } catch(e) {
+            return url.split('?')[0].split('#')[0];
+        }
+    }
+    
+    // Chercher dans tous les scripts
+    var scripts = document.getElementsByTagName('script');
+    for (var i = 0; i < scripts.length; i++) {
+        var content = scripts[i].innerHTML || scripts[i].textContent || '';
+        var matches = content.match(/https?:\\/\\/[^\\s"']+blogspot[^\\s"']*\\.(jpg|jpeg|png|webp)(\\?[^\\s"']*)?/gi);
+        if (matches) {
+            for (var j = 0; j < matches.length; j++) {
+                var url = matches[j];
+                if (isValid(url)) {
+                    var norm = normalize(url);
+                    if (!seen[norm]) {
+                        seen[norm] = true;
+                        urls.push(url);
+                    }
+                }
+            }
+        }
+    }
+    
+    // Chercher dans toutes les images du DOM
+    var images = document.getElementsByTagName('img');
+    for (var i = 0; i < images.length; i++) {
+        var img = images[i];
+        var src = img.src || img.getAttribute('src');
+        if (src && src.indexOf('data:image') === -1) {
+            if (!src.startsWith('http')) {
+                src = 'https:' + src;
+            }
+            if (isValid(src)) {
+                var norm = normalize(src);
+                if (!seen[norm]) {
+                    seen[norm] = true;
+                    urls.push(src);
+                }
+            }
+        }
+    }
+    
+    // Chercher aussi dans le HTML source complet pour être sûr
+    var htmlContent = document.documentElement.innerHTML;
+    var htmlMatches = htmlContent.match(/https?:\\/\\/[^\\s"']+blogspot[^\\s"']*\\.(jpg|jpeg|png|webp)(\\?[^\\s"']*)?/gi);
+    if (htmlMatches) {
+        for (var k = 0; k < htmlMatches.length; k++) {
+            var url = htmlMatches[k];
+            if (isValid(url)) {
+                var norm = normalize(url);
+                if (!seen[norm]) {
+                    seen[norm] = true;
+                    urls.push(url);
+                }
+            }
+        }
+    }
     
+    return urls;
+"""
+
+def normalize_url(url: str) -> str:
+    """Normalise l'URL pour détecter les doublons"""
     try:
-        driver.get(chapter_url)
-        
-        # Attendre que #divImage soit chargé
-        try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.ID, "divImage"))
-            )
-        except:
-            pass
-        
-        # Obtenir le nombre de pages depuis le select
-        page_count = 0
+        parsed = urlparse(url)
+        pathname = parsed.path
+        filename_match = re.search(r'/([^/]+\.(jpg|jpeg|png|webp))$', pathname, re.I)
+        if filename_match:
+            return filename_match.group(1).lower()
+        return pathname.split('?')[0].split('#')[0]
+    except:
+        filename_match = re.search(r'/([^/?#]+\.(jpg|jpeg|png|webp))$', url, re.I)
+        if filename_match:
+            return filename_match.group(1).lower()
+        return url.split('?')[0].split('#')[0]
+
+def is_valid_comic_page(url: str) -> bool:
+    """Vérifie si l'URL est une vraie page de comic"""
+    lower_url = url.lower()
+    
+    exclude_patterns = [
+        'logo', 'user-small', 'read.png', 'previous.png', 'next.png',
+        'error.png', 'search.png', 'button', 'icon', 'avatar',
+        'advertisement', 'ad', 'banner', 'widget', 'sharethis',
+        'facebook', 'twitter', 'google', 'discord', 'mgid.com',
+        'a-ads.com', 'lowseelor.com'
+    ]
+    
+    if any(pattern in lower_url for pattern in exclude_patterns):
+        return False
+    
+    is_valid_host = any(x in lower_url for x in ['blogspot', 'bp.blogspot', 'blogger.com'])
+    
+    has_comic_filename = (
+        re.search(r'rco\d+\.(jpg|jpeg|png|webp)', url, re.I) or
+        re.search(r'/s\d+/', url) or
+        re.search(r'/pw/', url) or
+        re.search(r'\.(jpg|jpeg|png|webp)(\?|$)', url, re.I)
+    )
+    
+    return is_valid_host and has_comic_filename
+
+def capture_chapter(driver, chapter_url: str) -> Dict:
+    """
+    Étape navigateur: charge le chapitre et capture le HTML brut et les URLs
+    collectées par JavaScript, sans aucun parsing côté Python
+    """
+    started_at = time.time()
+    driver.get(chapter_url)
+    
+    # Attendre que #divImage soit chargé
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.ID, "divImage"))
+        )
+    except:
+        pass
+    
+    # Obtenir le nombre de pages depuis le select
+    page_count = 0
+    page_select_element = None
+    try:
+        selects = driver.find_elements(By.CSS_SELECTOR, "select")
+        for select in selects:
+            options = select.find_elements(By.TAG_NAME, "option")
+            # Chercher le select qui contient des numéros de pages (généralement le deuxième)
+            if len(options) > 1 and options[0].text.strip().isdigit():
+                page_count = len(options)
+                page_select_element = select
+                print(f"Nombre de pages détecté dans le select: {page_count}")
+                break
+    except Exception as e:
+        print(f"Impossible de lire le select de pages: {e}")
+    
+    # Attendre que les images se chargent et scroller pour déclencher le chargement
+    time.sleep(2)
+    
+    # Scroller pour charger toutes les images
+    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+    time.sleep(2)
+    driver.execute_script("window.scrollTo(0, 0);")
+    time.sleep(2)
+    
+    # Attendre que toutes les images soient chargées
+    try:
+        WebDriverWait(driver, 10).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+    except:
+        pass
+    
+    time.sleep(2)
+    
+    page_source = driver.page_source
+    
+    # Compter les pages déjà présentes dans #divImage directement depuis le DOM,
+    # pour savoir s'il faut parcourir le select sans construire d'arbre HTML
+    div_image_sources = driver.execute_script("""
+        var imgs = document.querySelectorAll('#divImage img');
+        var srcs = [];
+        for (var i = 0; i < imgs.length; i++) {
+            var src = imgs[i].getAttribute('src');
+            if (src) srcs.push(src);
+        }
+        return srcs;
+    """) or []
+    div_image_pages = set()
+    for src in div_image_sources:
+        if 'data:image' in src:
+            continue
+        if not src.startswith('http'):
+            src = 'https:' + src
+        if is_valid_comic_page(src):
+            div_image_pages.add(normalize_url(src))
+    
+    # Méthode 2: Si on connaît le nombre de pages, parcourir toutes les pages
+    # pour collecter toutes les images
+    select_image_urls = []
+    if page_select_element is not None and len(div_image_pages) < page_count:
+        print(f"Parcours de toutes les {page_count} pages pour collecter les images...")
         try:
-            selects = driver.find_elements(By.CSS_SELECTOR, "select")
-            for select in selects:
-                options = select.find_elements(By.TAG_NAME, "option")
-                # Chercher le select qui contient des numéros de pages (généralement le deuxième)
-                if len(options) > 1 and options[0].text.strip().isdigit():
-                    page_count = len(options)
-                    print(f"Nombre de pages détecté dans le select: {page_count}")
-                    break
+            # Parcourir toutes les pages (commencer à 0 car selectedIndex est 0-based)
+            for page_num in range(0, page_count):
+                try:
+                    # Utiliser JavaScript directement pour changer la page
+                    driver.execute_script(f"""
+                        var select = arguments[0];
+                        select.selectedIndex = {page_num};
+                        var event = new Event('change', {{ bubbles: true }});
+                        select.dispatchEvent(event);
+                    """, page_select_element)
+                    time.sleep(2)  # Attendre le chargement de la page
+                    
+                    # Attendre que l'image soit chargée
+                    try:
+                        WebDriverWait(driver, 5).until(
+                            EC.presence_of_element_located((By.CSS_SELECTOR, "#divImage img"))
+                        )
+                    except:
+                        pass
+                    
+                    # Relever les images de la page actuelle
+                    try:
+                        current_imgs = driver.find_elements(By.CSS_SELECTOR, "#divImage img")
+                        for current_img in current_imgs:
+                            img_url = current_img.get_attribute("src")
+                            if img_url:
+                                select_image_urls.append(img_url)
+                    except Exception:
+                        # Si l'image n'est pas trouvée, continuer
+                        pass
+                except Exception:
+                    # Continuer même en cas d'erreur
+                    pass
         except Exception as e:
-            print(f"Impossible de lire le select de pages: {e}")
-        
-        # Attendre que les images se chargent et scroller pour déclencher le chargement
-        time.sleep(2)
-        
-        # Scroller pour charger toutes les images
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(2)
-        
-        # Attendre que toutes les images soient chargées
-        try:
-            WebDriverWait(driver, 10).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
-        except:
-            pass
-        
-        time.sleep(2)
-        
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        def normalize_url(url: str) -> str:
-            """Normalise l'URL pour détecter les doublons"""
-            try:
-                from urllib.parse import urlparse
-                parsed = urlparse(url)
-                pathname = parsed.path
-                filename_match = re.search(r'/([^/]+\.(jpg|jpeg|png|webp))$', pathname, re.I)
-                if filename_match:
-                    return filename_match.group(1).lower()
-                return pathname.split('?')[0].split('#')[0]
-            except:
-                filename_match = re.search(r'/([^/?#]+\.(jpg|jpeg|png|webp))$', url, re.I)
-                if filename_match:
-                    return filename_match.group(1).lower()
-                return url.split('?')[0].split('#')[0]
-        
-        def is_valid_comic_page(url: str) -> bool:
-            """Vérifie si l'URL est une vraie page de comic"""
-            lower_url = url.lower()
-            
-            exclude_patterns = [
-                'logo', 'user-small', 'read.png', 'previous.png', 'next.png',
-                'error.png', 'search.png', 'button', 'icon', 'avatar',
-                'advertisement', 'ad', 'banner', 'widget', 'sharethis',
-                'facebook', 'twitter', 'google', 'discord', 'mgid.com',
-                'a-ads.com', 'lowseelor.com'
-            ]
+            print(f"Erreur lors du parcours des pages: {e}")
+    
+    # Méthode 3: Utiliser JavaScript pour extraire toutes les URLs d'images depuis le DOM et les scripts
+    # Toujours exécuter cette méthode pour être sûr d'avoir toutes les pages
+    print("Extraction des URLs depuis JavaScript...")
+    script_image_urls = driver.execute_script(EXTRACT_IMAGE_URLS_JS)
+    
+    return {
+        'url': chapter_url,
+        'pageSource': page_source,
+        'pageCount': page_count,
+        'selectImageUrls': select_image_urls,
+        'scriptImageUrls': script_image_urls or [],
+        'startedAt': started_at,
+        'finishedAt': time.time()
+    }
+
+def parse_chapter_capture(capture: Dict) -> List[Dict]:
+    """
+    Étape parsing: construit la liste triée des pages à partir d'une capture
+    du navigateur. Fonction pure, exécutable dans un processus séparé
+    """
+    pages = []
+    seen_urls = set()
+    
+    def add_page(img_url: str) -> bool:
+        if not is_valid_comic_page(img_url):
+            return False
+        normalized = normalize_url(img_url)
+        if normalized in seen_urls:
+            return False
+        seen_urls.add(normalized)
+        pages.append({
+            'pageNumber': len(pages) + 1,
+            'imageUrl': img_url
+        })
+        return True
+    
+    soup = BeautifulSoup(capture['pageSource'], 'html.parser')
+    
+    # Méthode 1: Chercher dans #divImage
+    div_image = soup.find('div', id='divImage')
+    if div_image:
+        images = div_image.find_all('img')
+        for img in images:
+            img_url = img.get('src')
+            if not img_url or 'data:image' in img_url:
+                continue
             
-            if any(pattern in lower_url for pattern in exclude_patterns):
-                return False
+            if not img_url.startswith('http'):
+                img_url = 'https:' + img_url
             
-            is_valid_host = any(x in lower_url for x in ['blogspot', 'bp.blogspot', 'blogger.com'])
+            add_page(img_url)
+    
+    # Méthode 2: Images relevées en parcourant le select de pages
+    for img_url in capture['selectImageUrls']:
+        if not img_url.startswith('http'):
+            img_url = 'https:' + img_url
+        if add_page(img_url):
+            print(f"  Page {len(pages)} collectée")
+    
+    # Méthode 3: URLs extraites par JavaScript
+    image_urls = capture['scriptImageUrls']
+    if image_urls:
+        print(f"URLs trouvées dans JavaScript: {len(image_urls)}")
+        for img_url in image_urls:
+            add_page(img_url)
+    else:
+        print("Aucune URL trouvée dans JavaScript")
+    
+    # Méthode 3: Chercher dans les scripts avec BeautifulSoup (fallback)
+    if len(pages) < 5:
+        scripts = soup.find_all('script')
+        for script in scripts:
+            script_content = script.string or script.get_text()
+            if script_content:
+                matches = re.findall(
+                    r'https?://[^\s"\']+blogspot[^\s"\']*\.(jpg|jpeg|png|webp)(\?[^\s"\']*)?',
+                    script_content,
+                    re.I
+                )
+                for match in matches:
+                    img_url = match[0] if isinstance(match, tuple) else match
+                    add_page(img_url)
+    
+    # Méthode 3: Chercher toutes les images blogspot
+    if len(pages) < 5:
+        all_images = soup.find_all('img')
+        for img in all_images:
+            img_url = img.get('src')
+            if not img_url or 'data:image' in img_url:
+                continue
             
-            has_comic_filename = (
-                re.search(r'rco\d+\.(jpg|jpeg|png|webp)', url, re.I) or
-                re.search(r'/s\d+/', url) or
-                re.search(r'/pw/', url) or
-                re.search(r'\.(jpg|jpeg|png|webp)(\?|$)', url, re.I)
-            )
+            if not img_url.startswith('http'):
+                img_url = 'https:' + img_url
             
-            return is_valid_host and has_comic_filename
-        
-        # Méthode 1: Chercher dans #divImage
-        div_image = soup.find('div', id='divImage')
-        if div_image:
-            images = div_image.find_all('img')
-            for img in images:
-                img_url = img.get('src')
-                if not img_url or 'data:image' in img_url:
-                    continue
-                
-                if not img_url.startswith('http'):
-                    img_url = 'https:' + img_url
-                
-                if is_valid_comic_page(img_url):
-                    normalized = normalize_url(img_url)
-                    if normalized not in seen_urls:
-                        seen_urls.add(normalized)
-                        pages.append({
-                            'pageNumber': len(pages) + 1,
-                            'imageUrl': img_url
-                        })
-        
-        # Méthode 2: Si on connaît le nombre de pages, parcourir toutes les pages
-        # pour collecter toutes les images
-        if page_count > 0 and len(pages) < page_count:
-            print(f"Parcours de toutes les {page_count} pages pour collecter les images...")
-            try:
-                # Trouver le select de pages (généralement le deuxième select)
-                selects = driver.find_elements(By.CSS_SELECTOR, "select")
-                page_select_element = None
-                for sel in selects:
-                    options = sel.find_elements(By.TAG_NAME, "option")
-                    if len(options) > 1 and options[0].text.strip().isdigit():
-                        page_select_element = sel
-                        break
-                
-                if page_select_element:
-                    from selenium.webdriver.support.ui import Select
-                    page_select = Select(page_select_element)
-                    
-                    # Parcourir toutes les pages (commencer à 0 car selectedIndex est 0-based)
-                    for page_num in range(0, page_count):
+            add_page(img_url)
+    
+    # Trier par numéro de page
+    def get_page_number(page):
+        match = re.search(r'rco(\d+)', page['imageUrl'], re.I)
+        return int(match.group(1)) if match else page['pageNumber']
+    
+    pages.sort(key=get_page_number)
+    
+    # Réassigner les numéros
+    for i, page in enumerate(pages, 1):
+        page['pageNumber'] = i
+    
+    print(f"Pages trouvées: {len(pages)}")
+    return pages
+
+def _timed_parse_chapter_capture(capture: Dict) -> Dict:
+    """Exécute parse_chapter_capture dans un worker en mesurant son intervalle d'exécution"""
+    started_at = time.time()
+    pages = parse_chapter_capture(capture)
+    return {
+        'pages': pages,
+        'startedAt': started_at,
+        'finishedAt': time.time()
+    }
+
+def scrape_chapter_pages(chapter_url: str, delay: float = 1.0) -> List[Dict]:
+    """Scrape toutes les pages d'un chapitre"""
+    print(f"Scraping des pages du chapitre: {chapter_url}")
+    time.sleep(delay)
+    
+    driver = setup_driver()
+    try:
+        capture = capture_chapter(driver, chapter_url)
+    finally:
+        driver.quit()
+    
+    return parse_chapter_capture(capture)
+
+def _overlap_seconds(intervals_a: List[tuple], intervals_b: List[tuple]) -> float:
+    """Durée totale pendant laquelle deux ensembles d'intervalles se chevauchent"""
+    total = 0.0
+    for start_a, end_a in intervals_a:
+        for start_b, end_b in intervals_b:
+            total += max(0.0, min(end_a, end_b) - max(start_a, start_b))
+    return total
+
+def _driver_alive(driver) -> bool:
+    """Vérifie que la session du navigateur répond encore"""
+    try:
+        driver.current_url
+        return True
+    except WebDriverException:
+        return False
+
+def _sleep_interval(seconds: float, intervals: List[tuple]):
+    """Attend `seconds` et enregistre l'intervalle d'attente"""
+    started_at = time.time()
+    time.sleep(seconds)
+    intervals.append((started_at, time.time()))
+
+def scrape_chapters_pipelined(chapters: List[Dict], delay_between_chapters: float = 2.0,
+                              delay_between_pages: float = 0.5,
+                              workers: int = 2) -> Dict:
+    """
+    Scrape les pages de plusieurs chapitres en pipeline: le navigateur charge
+    le chapitre N+1 pendant que le chapitre N est analysé dans un pool de processus.
+    Remplit 'pages' et 'pageCount' de chaque chapitre et retourne un rapport de chevauchement
+    """
+    wall_started_at = time.time()
+    capture_intervals = []
+    delay_intervals = []
+    parse_intervals = []
+    futures = []
+    
+    driver = setup_driver()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for i, chapter in enumerate(chapters, 1):
+                print(f"Chapitre {i}/{len(chapters)}: {chapter['title']}")
+                print(f"Capture du chapitre: {chapter['url']}")
+                _sleep_interval(delay_between_pages, delay_intervals)
+                try:
+                    capture = capture_chapter(driver, chapter['url'])
+                    capture_intervals.append((capture['startedAt'], capture['finishedAt']))
+                    futures.append((chapter, executor.submit(_timed_parse_chapter_capture, capture)))
+                except WebDriverException as e:
+                    print(f"Erreur lors du scraping du chapitre {chapter['title']}: {e}")
+                    # Ne relancer Chrome que si la session est réellement morte
+                    # (un timeout ou une erreur JavaScript laissent la session utilisable)
+                    if isinstance(e, InvalidSessionIdException) or not _driver_alive(driver):
+                        print("Session du navigateur perdue, redémarrage...")
                         try:
-                            # Utiliser JavaScript directement pour changer la page
-                            driver.execute_script(f"""
-                                var select = arguments[0];
-                                select.selectedIndex = {page_num};
-                                var event = new Event('change', {{ bubbles: true }});
-                                select.dispatchEvent(event);
-                            """, page_select_element)
-                            time.sleep(2)  # Attendre le chargement de la page
-                            
-                            # Attendre que l'image soit chargée
-                            try:
-                                WebDriverWait(driver, 5).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, "#divImage img"))
-                                )
-                            except:
-                                pass
-                            
-                            # Extraire l'image de la page actuelle
-                            try:
-                                # Attendre que l'image soit chargée
-                                WebDriverWait(driver, 5).until(
-                                    EC.presence_of_element_located((By.CSS_SELECTOR, "#divImage img"))
-                                )
-                                
-                                current_imgs = driver.find_elements(By.CSS_SELECTOR, "#divImage img")
-                                for current_img in current_imgs:
-                                    img_url = current_img.get_attribute("src")
-                                    if img_url:
-                                        if not img_url.startswith('http'):
-                                            img_url = 'https:' + img_url
-                                        
-                                        if is_valid_comic_page(img_url):
-                                            normalized = normalize_url(img_url)
-                                            if normalized not in seen_urls:
-                                                seen_urls.add(normalized)
-                                                pages.append({
-                                                    'pageNumber': len(pages) + 1,
-                                                    'imageUrl': img_url
-                                                })
-                                                print(f"  Page {len(pages)} collectée")
-                            except Exception as img_error:
-                                # Si l'image n'est pas trouvée, continuer
-                                pass
-                        except Exception as e:
-                            # Continuer même en cas d'erreur
+                            driver.quit()
+                        except Exception:
                             pass
-            except Exception as e:
-                print(f"Erreur lors du parcours des pages: {e}")
-        
-        # Méthode 3: Utiliser JavaScript pour extraire toutes les URLs d'images depuis le DOM et les scripts
-        # Toujours exécuter cette méthode pour être sûr d'avoir toutes les pages
-        print("Extraction des URLs depuis JavaScript...")
-        image_urls = driver.execute_script("""
-                var urls = [];
-                var seen = {};
-                
-                // Fonction pour vérifier si c'est une page valide
-                function isValid(url) {
-                    var lower = url.toLowerCase();
-                    var exclude = ['logo', 'user-small', 'read.png', 'previous.png', 'next.png', 
-                                   'error.png', 'search.png', 'button', 'icon', 'avatar',
-                                   'advertisement', 'ad', 'banner', 'widget', 'sharethis',
-                                   'facebook', 'twitter', 'google', 'discord', 'mgid.com',
-                                   'a-ads.com', 'lowseelor.com'];
-                    for (var i = 0; i < exclude.length; i++) {
-                        if (lower.indexOf(exclude[i]) !== -1) return false;
-                    }
-                    var isBlogspot = lower.indexOf('blogspot') !== -1 || 
-                                   lower.indexOf('bp.blogspot') !== -1 ||
-                                   lower.indexOf('blogger.com') !== -1;
-                    var hasImage = /rco\\d+\\.(jpg|jpeg|png|webp)/i.test(url) ||
-                                  /\\/s\\d+\\//.test(url) ||
-                                  /\\/pw\\//.test(url) ||
-                                  /\\.(jpg|jpeg|png|webp)(\\?|$)/i.test(url);
-                    return isBlogspot && hasImage;
-                }
-                
-                // Normaliser l'URL
-                function normalize(url) {
-                    try {
-                        var match = url.match(/\\/([^/\\?#]+\\.(jpg|jpeg|png|webp))$/i);
-                        if (match) return match[1].toLowerCase();
-                        return url.split('?')[0].split('#')[0];
-                    } catch(e) {
-                        return url.split('?')[0].split('#')[0];
-                    }
-                }
-                
-                // Chercher dans tous les scripts
-                var scripts = document.getElementsByTagName('script');
-                for (var i = 0; i < scripts.length; i++) {
-                    var content = scripts[i].innerHTML || scripts[i].textContent || '';
-                    var matches = content.match(/https?:\\/\\/[^\\s"']+blogspot[^\\s"']*\\.(jpg|jpeg|png|webp)(\\?[^\\s"']*)?/gi);
-                    if (matches) {
-                        for (var j = 0; j < matches.length; j++) {
-                            var url = matches[j];
-                            if (isValid(url)) {
-                                var norm = normalize(url);
-                                if (!seen[norm]) {
-                                    seen[norm] = true;
-                                    urls.push(url);
-                                }
-                            }
-                        }
-                    }
-                }
-                
-                // Chercher dans toutes les images du DOM
-                var images = document.getElementsByTagName('img');
-                for (var i = 0; i < images.length; i++) {
-                    var img = images[i];
-                    var src = img.src || img.getAttribute('src');
-                    if (src && src.indexOf('data:image') === -1) {
-                        if (!src.startsWith('http')) {
-                            src = 'https:' + src;
-                        }
-                        if (isValid(src)) {
-                            var norm = normalize(src);
-                            if (!seen[norm]) {
-                                seen[norm] = true;
-                                urls.push(src);
-                            }
-                        }
-                    }
-                }
-                
-                // Chercher aussi dans le HTML source complet pour être sûr
-                var htmlContent = document.documentElement.innerHTML;
-                var htmlMatches = htmlContent.match(/https?:\\/\\/[^\\s"']+blogspot[^\\s"']*\\.(jpg|jpeg|png|webp)(\\?[^\\s"']*)?/gi);
-                if (htmlMatches) {
-                    for (var k = 0; k < htmlMatches.length; k++) {
-                        var url = htmlMatches[k];
-                        if (isValid(url)) {
-                            var norm = normalize(url);
-                            if (!seen[norm]) {
-                                seen[norm] = true;
-                                urls.push(url);
-                            }
-                        }
-                    }
-                }
+                        driver = None
+                        try:
+                            driver = setup_driver()
+                        except SystemExit:
+                            # Conserver les chapitres déjà capturés
+                            print("Impossible de relancer le navigateur, arrêt des captures")
+                            break
+                except Exception as e:
+                    print(f"Erreur lors du scraping du chapitre {chapter['title']}: {e}")
                 
-                return urls;
-            """)
-        
-        if image_urls:
-            print(f"URLs trouvées dans JavaScript: {len(image_urls)}")
-            for img_url in image_urls:
-                if is_valid_comic_page(img_url):
-                    normalized = normalize_url(img_url)
-                    if normalized not in seen_urls:
-                        seen_urls.add(normalized)
-                        pages.append({
-                            'pageNumber': len(pages) + 1,
-                            'imageUrl': img_url
-                        })
-        else:
-            print("Aucune URL trouvée dans JavaScript")
-        
-        # Méthode 3: Chercher dans les scripts avec BeautifulSoup (fallback)
-        if len(pages) < 5:
-            scripts = soup.find_all('script')
-            for script in scripts:
-                script_content = script.string or script.get_text()
-                if script_content:
-                    matches = re.findall(
-                        r'https?://[^\s"\']+blogspot[^\s"\']*\.(jpg|jpeg|png|webp)(\?[^\s"\']*)?',
-                        script_content,
-                        re.I
-                    )
-                    for match in matches:
-                        img_url = match[0] if isinstance(match, tuple) else match
-                        if is_valid_comic_page(img_url):
-                            normalized = normalize_url(img_url)
-                            if normalized not in seen_urls:
-                                seen_urls.add(normalized)
-                                pages.append({
-                                    'pageNumber': len(pages) + 1,
-                                    'imageUrl': img_url
-                                })
-        
-        # Méthode 3: Chercher toutes les images blogspot
-        if len(pages) < 5:
-            all_images = soup.find_all('img')
-            for img in all_images:
-                img_url = img.get('src')
-                if not img_url or 'data:image' in img_url:
+                if i < len(chapters):
+                    _sleep_interval(delay_between_chapters, delay_intervals)
+            
+            # Le navigateur n'est plus nécessaire pendant la fin du parsing
+            if driver is not None:
+                driver.quit()
+                driver = None
+            
+            for chapter, future in futures:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Erreur lors de l'analyse du chapitre {chapter['title']}: {e}")
                     continue
-                
-                if not img_url.startswith('http'):
-                    img_url = 'https:' + img_url
-                
-                if is_valid_comic_page(img_url):
-                    normalized = normalize_url(img_url)
-                    if normalized not in seen_urls:
-                        seen_urls.add(normalized)
-                        pages.append({
-                            'pageNumber': len(pages) + 1,
-                            'imageUrl': img_url
-                        })
-        
-        # Trier par numéro de page
-        def get_page_number(page):
-            match = re.search(r'rco(\d+)', page['imageUrl'], re.I)
-            return int(match.group(1)) if match else page['pageNumber']
-        
-        pages.sort(key=get_page_number)
-        
-        # Réassigner les numéros
-        for i, page in enumerate(pages, 1):
-            page['pageNumber'] = i
-        
-        print(f"Pages trouvées: {len(pages)}")
-        return pages
-        
+                chapter['pages'] = result['pages']
+                chapter['pageCount'] = len(result['pages'])
+                parse_intervals.append((result['startedAt'], result['finishedAt']))
     finally:
-        driver.quit()
+        if driver is not None:
+            driver.quit()
+    
+    wall_time = time.time() - wall_started_at
+    capture_time = sum(end - start for start, end in capture_intervals)
+    parse_time = sum(end - start for start, end in parse_intervals)
+    # Parsing effectué pendant qu'un autre chapitre se chargeait dans le navigateur
+    overlap = _overlap_seconds(capture_intervals, parse_intervals)
+    # Parsing effectué pendant les délais de politesse, compté à part
+    delay_overlap = _overlap_seconds(delay_intervals, parse_intervals)
+    
+    return {
+        'chapters': len(chapters),
+        'workers': workers,
+        'wallTime': wall_time,
+        'captureTime': capture_time,
+        'delayTime': sum(end - start for start, end in delay_intervals),
+        'parseTime': parse_time,
+        'overlapTime': overlap,
+        'overlapRatio': overlap / parse_time if parse_time > 0 else 0.0,
+        'delayOverlapTime': delay_overlap,
+        'delayOverlapRatio': delay_overlap / parse_time if parse_time > 0 else 0.0
+    }
+
+def print_pipeline_report(report: Dict):
+    """Affiche le rapport de chevauchement du mode pipeline"""
+    print(f"⏱️  Pipeline ({report['workers']} workers, {report['chapters']} chapitres):")
+    print(f"   - Temps total: {report['wallTime']:.1f}s")
+    print(f"   - Capture navigateur: {report['captureTime']:.1f}s")
+    print(f"   - Délais: {report['delayTime']:.1f}s")
+    print(f"   - Parsing: {report['parseTime']:.1f}s")
+    print(f"   - Chevauchement capture/parsing: {report['overlapTime']:.1f}s "
+          f"({report['overlapRatio'] * 100:.0f}% du parsing pendant le chargement d'un chapitre)")
+    print(f"   - Parsing masqué par les délais: {report['delayOverlapTime']:.1f}s "
+          f"({report['delayOverlapRatio'] * 100:.0f}% du parsing)")
 
 def scrape_full_series(comic_url: str, max_chapters: Optional[int] = None, 
                        delay_between_chapters: float = 2.0,
-                       delay_between_pages: float = 0.5) -> Dict:
+                       delay_between_pages: float = 0.5,
+                       pipeline: bool = False, workers: int = 2) -> Dict:
     """Scrape une série complète avec tous ses chapitres et pages"""
     series = scrape_comic_series(comic_url)
     
@@ -622,6 +772,13 @@ def scrape_full_series(comic_url: str, max_chapters: Optional[int] = None,
     
     print(f"Scraping de {len(chapters_to_scrape)} chapitres...")
     
+    if pipeline:
+        report = scrape_chapters_pipelined(chapters_to_scrape, delay_between_chapters,
+                                           delay_between_pages, workers)
+        print_pipeline_report(report)
+        series['totalChapters'] = len(chapters_to_scrape)
+        return series
+    
     for i, chapter in enumerate(chapters_to_scrape, 1):
         print(f"Chapitre {i}/{len(chapters_to_scrape)}: {chapter['title']}")
         try:
@@ -648,17 +805,23 @@ Usage:
 Options:
   --max-chapters <number>    Limite le nombre de chapitres à scraper
   --output <path>            Chemin du fichier de sortie (défaut: ./data/<comic-id>.json)
+  --pipeline                 Analyse les chapitres dans un pool de processus pendant que
+                             le navigateur charge les suivants
+  --workers <number>         Nombre de processus d'analyse en mode pipeline (défaut: 2)
   
 Exemples:
   python scraper.py "https://readcomiconline.li/Comic/Batman-2025"
   python scraper.py "https://readcomiconline.li/Comic/Batman-2025" --max-chapters 5
   python scraper.py "https://readcomiconline.li/Comic/Batman-2025" --output ./data/batman.json
+  python scraper.py "https://readcomiconline.li/Comic/Batman-2025" --pipeline --workers 4
         """)
         sys.exit(1)
     
     comic_url = sys.argv[1]
     max_chapters = None
     output_path = None
+    pipeline = False
+    workers = 2
     
     # Parser les arguments
     i = 2
@@ -669,15 +832,24 @@ Exemples:
         elif sys.argv[i] == "--output" and i + 1 < len(sys.argv):
             output_path = sys.argv[i + 1]
             i += 2
+        elif sys.argv[i] == "--pipeline":
+            pipeline = True
+            i += 1
+        elif sys.argv[i] == "--workers" and i + 1 < len(sys.argv):
+            workers = int(sys.argv[i + 1])
+            i += 2
         else:
             i += 1
     
     print(f"\n🚀 Début du scraping de: {comic_url}")
     if max_chapters:
         print(f"📚 Limite: {max_chapters} chapitres")
+    if pipeline:
+        print(f"🔀 Mode pipeline: {workers} workers d'analyse")
     
     try:
-        series = scrape_full_series(comic_url, max_chapters=max_chapters)
+        series = scrape_full_series(comic_url, max_chapters=max_chapters,
+                                    pipeline=pipeline, workers=workers)
         
         # Générer un nom de fichier unique basé sur l'ID du comic si non spécifié
         if not output_path:
@@ -0,0 +1,153 @@
+"""Tests du vérificateur de liens contre un serveur local de substitution"""
+
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+import check_links
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    in_flight = 0
+    peak = 0
+    hits = Counter()
+    lock = threading.Lock()
+
+    def _respond(self, with_body):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.peak = max(cls.peak, cls.in_flight)
+            cls.hits[self.path] += 1
+            hits = cls.hits[self.path]
+        try:
+            time.sleep(0.05)
+            if self.path.startswith('/missing'):
+                self.send_response(404)
+                self.end_headers()
+            elif self.path.startswith('/empty'):
+                self.send_response(416 if 'Range' in self.headers else 405)
+                self.end_headers()
+            elif self.path.startswith('/busy') or (self.path.startswith('/flaky') and hits == 1):
+                self.send_response(503 if self.path.startswith('/flaky') else 429)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+            else:
+                self.send_response(200)
+                self.send_header("Content-Type", "image/jpeg")
+                self.send_header("Content-Length", "1")
+                self.end_headers()
+                if with_body:
+                    self.wfile.write(b"x")
+        finally:
+            with cls.lock:
+                cls.in_flight -= 1
+
+    def do_HEAD(self):
+        if self.path.startswith('/empty'):
+            self.send_response(405)
+            self.end_headers()
+            return
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_server(serve):
+    StandInHandler.peak = 0
+    StandInHandler.hits.clear()
+    return serve(StandInHandler)
+
+
+def make_checker(**kwargs):
+    kwargs.setdefault('backoff_factor', 0)
+    return check_links.LinkChecker(**kwargs)
+
+
+def test_statuses_and_invalid_urls(stand_in_server):
+    urls = [f"{stand_in_server}/p1.jpg", f"{stand_in_server}/missing.jpg",
+            f"{stand_in_server}/empty.jpg", "http://[bad"]
+    results = make_checker(concurrency=4).check_all(urls)
+
+    assert results[urls[0]]['ok']
+    assert results[urls[1]] == {'url': urls[1], 'ok': False, 'unknown': False,
+                                'status': 404, 'error': 'HTTP 404'}
+    assert results[urls[2]]['ok'] and results[urls[2]]['status'] == 416
+    assert results[urls[3]] == {'url': urls[3], 'ok': False, 'unknown': False,
+                                'status': None, 'error': 'InvalidURL'}
+
+
+def test_transient_errors_are_retried_then_unknown(stand_in_server):
+    flaky, busy = f"{stand_in_server}/flaky.jpg", f"{stand_in_server}/busy.jpg"
+    results = make_checker(concurrency=2, retries=2).check_all([flaky, busy])
+
+    assert results[flaky]['ok']
+    assert results[busy]['unknown'] and results[busy]['status'] == 429
+    assert StandInHandler.hits['/busy.jpg'] == 3
+
+
+def test_connection_errors_are_unknown():
+    # Port fermé: erreur de connexion après les retries
+    url = "http://127.0.0.1:9/p1.jpg"
+    results = make_checker(retries=1).check_all([url])
+
+    assert results[url]['unknown'] and results[url]['error'] == 'ConnectionError'
+
+
+def test_single_host_uses_full_concurrency(stand_in_server):
+    urls = [f"{stand_in_server}/p{i}.jpg" for i in range(200)]
+    results = make_checker(concurrency=32).check_all(urls)
+
+    assert all(result['ok'] for result in results.values())
+    assert StandInHandler.peak > 16
+
+
+def test_per_host_limit_is_respected(stand_in_server):
+    urls = [f"{stand_in_server}/p{i}.jpg" for i in range(100)]
+    make_checker(concurrency=32, per_host=4).check_all(urls)
+
+    assert StandInHandler.peak <= 4
+
+
+def test_unknown_method_is_rejected():
+    with pytest.raises(ValueError):
+        check_links.LinkChecker(method='get')
+
+
+def build_test_report(server, threshold):
+    good = [{'pageNumber': i, 'imageUrl': f"{server}/p{i}.jpg"} for i in range(1, 5)]
+    bad = good[:2] + [{'pageNumber': 3, 'imageUrl': f"{server}/missing.jpg"}]
+    busy = good[:1] + [{'pageNumber': 2, 'imageUrl': f"{server}/busy.jpg"}]
+    comics = [{'file': 't.json', 'series': {'id': 'T', 'chapters': [
+        {'id': 'chapter-1', 'url': 'u1', 'pages': good},
+        {'id': 'chapter-2', 'url': 'u2', 'pages': bad},
+        {'id': 'chapter-3', 'url': 'u3', 'pages': busy},
+    ]}}]
+    urls = [page['imageUrl'] for page in good + bad + busy]
+    results = make_checker(retries=0).check_all(urls)
+    return check_links.build_report(comics, results, threshold)
+
+
+def test_build_report_flags_chapters_over_threshold(stand_in_server):
+    report = build_test_report(stand_in_server, 0.2)
+    chapters = report['comics'][0]['chapters']
+
+    assert [entry['chapterId'] for entry in report['rescrape']] == ['chapter-2']
+    assert chapters[1]['failureRate'] == pytest.approx(1 / 3, abs=1e-4)
+    # Le 429 persistant est inconnu et exclu du taux d'échec
+    assert chapters[2]['unknown'] == 1 and chapters[2]['failureRate'] == 0.0
+    assert report['failedUrls'] == 1 and report['unknownUrls'] == 1
+
+
+def test_zero_threshold_only_flags_chapters_with_failures(stand_in_server):
+    report = build_test_report(stand_in_server, 0)
+
+    assert [entry['chapterId'] for entry in report['rescrape']] == ['chapter-2']
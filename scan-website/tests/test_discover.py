@@ -0,0 +1,96 @@
+"""Tests du crawler de découverte contre un site local de substitution"""
+
+from http.server import BaseHTTPRequestHandler
+
+import pytest
+
+import discover
+
+# Trois pages de listing qui se référencent mutuellement, plus une page en erreur
+SITE = {
+    "/ComicList": '<a href="/Genre/Sci-Fi">Sci-Fi</a><a href="/Comic/Batman-2025">Batman</a>',
+    "/Genre/Sci-Fi": '<a href="/ComicList">Liste</a><a href="/Publisher/DC-Comics">DC Comics</a>'
+                     '<a href="/Comic/Batman-2025">Batman</a><a href="/Genre/Broken">x</a>'
+                     '<a href="/Genre/Sci-Fi?page=2">2</a>',
+    "/Genre/Sci-Fi?page=2": '<a href="/Comic/Superman">Superman</a>',
+    "/Publisher/DC-Comics": '<a href="/Genre/Sci-Fi">Sci-Fi</a><a href="/Comic/Superman">Superman</a>',
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = SITE.get(self.path)
+        if body is None:
+            self.send_response(403)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.end_headers()
+        self.wfile.write(f"<html><body>{body}</body></html>".encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in_site(serve, monkeypatch):
+    base_url = serve(StandInHandler)
+    monkeypatch.setattr(discover, "BASE_URL", base_url)
+    return base_url
+
+
+def test_crawl_with_zero_ttl_stops(stand_in_site, tmp_path):
+    frontier = discover.Frontier(str(tmp_path / "frontier.db"), ttl=0)
+    try:
+        stats = discover.discover_series(frontier, [f"{stand_in_site}/ComicList"],
+                                         concurrency=4, delay=0, max_pages=100)
+        series = frontier.all_series()
+    finally:
+        frontier.close()
+
+    # 4 pages valides + 1 page en erreur, chacune visitée une seule fois
+    assert stats == {'fetched': 4, 'errors': 1}
+    assert [s['id'] for s in series] == ['Batman-2025', 'Superman']
+
+
+def test_facets_use_link_text(stand_in_site, tmp_path):
+    frontier = discover.Frontier(str(tmp_path / "frontier.db"), ttl=3600)
+    try:
+        discover.discover_series(frontier, [f"{stand_in_site}/ComicList"], concurrency=1, delay=0)
+        series = {s['id']: s for s in frontier.all_series()}
+    finally:
+        frontier.close()
+
+    assert series['Batman-2025']['genres'] == ['Sci-Fi']
+    # Série vue sur la page 2 du genre: le libellé vient du lien vers la page 1
+    assert series['Superman']['genres'] == ['Sci-Fi']
+    assert series['Superman']['publishers'] == ['DC Comics']
+
+
+def test_facet_falls_back_to_decoded_slug():
+    assert discover.listing_facet("https://readcomiconline.li/Genre/Sci-Fi%20Noir") == ('genre', 'Sci-Fi Noir')
+
+
+def test_failed_listing_stays_due(stand_in_site, tmp_path):
+    frontier = discover.Frontier(str(tmp_path / "frontier.db"), ttl=3600)
+    try:
+        discover.discover_series(frontier, [f"{stand_in_site}/ComicList"], concurrency=2, delay=0)
+        assert frontier.next_due(10, set()) == [f"{stand_in_site}/Genre/Broken"]
+    finally:
+        frontier.close()
+
+
+def test_rejected_seeds_are_reported(stand_in_site, tmp_path, capsys):
+    frontier = discover.Frontier(str(tmp_path / "frontier.db"), ttl=3600)
+    try:
+        stats = discover.discover_series(
+            frontier, ["https://example.com/Genre/Action", f"{stand_in_site}/Comic/Batman-2025"],
+            delay=0
+        )
+    finally:
+        frontier.close()
+
+    output = capsys.readouterr().out
+    assert stats == {'fetched': 0, 'errors': 0}
+    assert "ignorée" in output and "example.com" in output and "/Comic/Batman-2025" in output
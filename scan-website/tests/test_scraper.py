@@ -0,0 +1,129 @@
+"""Tests de l'étape de parsing et du mode pipeline du scraper"""
+
+import pytest
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException
+
+import scraper
+
+
+def make_capture(page_source, select_image_urls=(), script_image_urls=()):
+    return {
+        'url': 'https://readcomiconline.li/Comic/Test/Issue-1',
+        'pageSource': page_source,
+        'pageCount': 0,
+        'selectImageUrls': list(select_image_urls),
+        'scriptImageUrls': list(script_image_urls),
+        'startedAt': 0.0,
+        'finishedAt': 1.0,
+    }
+
+
+def blogspot(n, query=''):
+    return f"https://2.bp.blogspot.com/pw/rco{n:03d}.jpg{query}"
+
+
+def test_parse_dedups_and_sorts_by_rco_number():
+    div_image = ''.join(f'<img src="{blogspot(n)}">' for n in (3, 1, 5))
+    capture = make_capture(
+        f'<div id="divImage">{div_image}</div>',
+        select_image_urls=[blogspot(2), blogspot(1, '?t=2')],
+        script_image_urls=[blogspot(4), blogspot(3, '?t=9'), 'https://2.bp.blogspot.com/logo.png'],
+    )
+
+    pages = scraper.parse_chapter_capture(capture)
+
+    assert pages == [{'pageNumber': i, 'imageUrl': blogspot(i)} for i in range(1, 6)]
+
+
+def test_parse_falls_back_to_all_images_when_few_pages():
+    capture = make_capture(
+        f'<div id="divImage"><img src="{blogspot(1)}"></div>'
+        f'<div class="other"><img src="//2.bp.blogspot.com/pw/rco002.jpg">'
+        f'<img src="data:image/png;base64,xx"><img src="https://mgid.com/ad.jpg"></div>'
+    )
+
+    pages = scraper.parse_chapter_capture(capture)
+
+    assert [page['imageUrl'] for page in pages] == [blogspot(1), blogspot(2)]
+
+
+def test_parse_skips_fallback_with_enough_pages():
+    div_image = ''.join(f'<img src="{blogspot(n)}">' for n in range(1, 6))
+    capture = make_capture(
+        f'<div id="divImage">{div_image}</div><img src="{blogspot(6)}">'
+    )
+
+    pages = scraper.parse_chapter_capture(capture)
+
+    assert len(pages) == 5
+
+
+def test_overlap_seconds():
+    assert scraper._overlap_seconds([(0, 5), (6, 10)], [(4, 7)]) == pytest.approx(2.0)
+    assert scraper._overlap_seconds([(0, 1)], [(1, 2)]) == 0.0
+    assert scraper._overlap_seconds([(0, 10)], [(2, 3), (5, 8)]) == pytest.approx(4.0)
+    assert scraper._overlap_seconds([], [(0, 1)]) == 0.0
+
+
+class FakeDriver:
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.quit_calls = 0
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise InvalidSessionIdException("session deleted")
+        return 'about:blank'
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def run_pipeline(monkeypatch, errors, restart_fails=False):
+    drivers = []
+
+    def fake_setup_driver():
+        if drivers and restart_fails:
+            raise SystemExit(1)
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    def fake_capture(driver, url):
+        error = errors.get(url)
+        if error is not None:
+            if isinstance(error, InvalidSessionIdException):
+                driver.alive = False
+            raise error
+        return make_capture(f'<div id="divImage"><img src="{blogspot(1)}"></div>')
+
+    monkeypatch.setattr(scraper, 'setup_driver', fake_setup_driver)
+    monkeypatch.setattr(scraper, 'capture_chapter', fake_capture)
+    chapters = [{'title': f'c{i}', 'url': f'u{i}'} for i in range(4)]
+    report = scraper.scrape_chapters_pipelined(chapters, delay_between_chapters=0,
+                                               delay_between_pages=0, workers=1)
+    return chapters, drivers, report
+
+
+def test_pipeline_keeps_driver_on_timeout(monkeypatch):
+    chapters, drivers, _ = run_pipeline(monkeypatch, {'u1': TimeoutException("slow")})
+
+    assert len(drivers) == 1
+    assert [chapter.get('pageCount') for chapter in chapters] == [1, None, 1, 1]
+
+
+def test_pipeline_restarts_dead_session(monkeypatch):
+    chapters, drivers, _ = run_pipeline(monkeypatch, {'u1': InvalidSessionIdException("gone")})
+
+    assert len(drivers) == 2
+    assert [chapter.get('pageCount') for chapter in chapters] == [1, None, 1, 1]
+
+
+def test_pipeline_keeps_captured_chapters_when_restart_fails(monkeypatch):
+    chapters, drivers, report = run_pipeline(
+        monkeypatch, {'u2': InvalidSessionIdException("gone")}, restart_fails=True
+    )
+
+    assert len(drivers) == 1
+    assert [chapter.get('pageCount') for chapter in chapters] == [1, 1, None, None]
+    assert report['captureTime'] >= 0 and report['delayOverlapTime'] >= 0